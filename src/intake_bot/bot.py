@@ -1,3 +1,4 @@
+import asyncio
 import os
 from collections.abc import Awaitable, Callable
 
@@ -57,6 +58,7 @@ from intake_bot.nodes.nodes import (
     caller_ended_conversation,
     end_conversation,
     node_initial,
+    prompts,
 )
 from intake_bot.nodes.utils import log_flow_manager_state, save_state_to_json
 from intake_bot.services.legalserver import save_intake_legalserver
@@ -65,7 +67,6 @@ from intake_bot.utils.daily_dialin import (
     normalize_daily_dialin_body,
 )
 from intake_bot.utils.ev import ev_is_true, get_ev, require_ev
-from intake_bot.utils.node_prompts import NodePrompts
 
 TransportSetup = Callable[
     [BaseTransport, PipelineTask, FlowManager, str], Awaitable[None]
@@ -186,6 +187,20 @@ class AdaptiveIdleTimeout:
         return self.base_timeout_secs + extra_timeout_secs
 
 
+def install_eager_task_factory() -> None:
+    """
+    Install asyncio's eager task factory on the running loop when
+    ENABLE_EAGER_TASKS is set.
+
+    The loop is shared by every call, so an existing factory is left alone.
+    """
+    if not ev_is_true("ENABLE_EAGER_TASKS"):
+        return
+    loop = asyncio.get_running_loop()
+    if loop.get_task_factory() is None:
+        loop.set_task_factory(asyncio.eager_task_factory)
+
+
 async def bot(runner_args: RunnerArguments):
     """Main bot entry point for Daily local and Pipecat Cloud runtimes."""
     body = runner_args.body if isinstance(runner_args.body, dict) else {}
@@ -304,6 +319,8 @@ async def run_bot(
     """
     Main function to set up and run the VLAS intake bot.
     """
+    install_eager_task_factory()
+
     stt = AzureSTTService(
         api_key=require_ev("AZURE_API_KEY"),
         region=require_ev("AZURE_SPEECH_REGION"),
@@ -340,7 +357,6 @@ async def run_bot(
         endpoint=require_ev("AZURE_LLM_ENDPOINT"),
         settings=AzureLLMService.Settings(model=summary_llm_model),
     )
-    prompts = NodePrompts()
     summarization_prompt = prompts.get("reset_with_summary")
 
     context = LLMContext()
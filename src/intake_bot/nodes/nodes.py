@@ -1,5 +1,5 @@
-import sys
 import unicodedata
+from types import MappingProxyType
 
 from intake_bot.models.intake_flow_result import (
     AddressResult,
@@ -61,6 +61,12 @@ prompts = NodePrompts()
 validator = IntakeValidator()
 sms_service = SMS()
 _ADVERSE_PARTIES_FOLLOW_UP_KEY = "_adverse_parties_follow_up_requested"
+_INITIAL_PROMPT = get_ev("TEST_INITIAL_PROMPT", default="initial")
+_INITIAL_FUNCTION_NAME = get_ev("TEST_INITIAL_FUNCTION", default="system_phone_number")
+# The primary role message is static, so build the shared base of every
+# record_* node once. It is read-only; call sites unpack it into the new
+# dict they build for each node.
+_PARTIAL_RESET_NODE = MappingProxyType(prompts.get("primary_role_message"))
 
 
 ######################################################################
@@ -72,31 +78,20 @@ def node_initial() -> NodeConfig:
     """
     Create initial node for welcoming the caller. Allow the conversation to be ended.
     """
-    initial_prompt = get_ev("TEST_INITIAL_PROMPT", default="initial")
-    initial_function_name = get_ev(
-        "TEST_INITIAL_FUNCTION", default="system_phone_number"
-    )
-    try:
-        initial_function = getattr(
-            sys.modules[__name__],
-            initial_function_name,
-        )
-    except AttributeError:
-        raise ValueError(
-            f"""Function '{initial_function_name}' does not exist."""
-        ) from None
+    initial_function = _flow_function(_INITIAL_FUNCTION_NAME)
 
     return {
         **prompts.get("primary_role_message"),
-        **prompts.get(initial_prompt),
+        **prompts.get(_INITIAL_PROMPT),
         "functions": [initial_function],
     }
 
 
-def node_partial_reset_with_summary() -> NodeConfig:
-    return {
-        **prompts.get("primary_role_message"),
-    }
+def _flow_function(name: str):
+    try:
+        return _FLOW_FUNCTIONS[name]
+    except KeyError:
+        raise ValueError(f"""Function '{name}' does not exist.""") from None
 
 
 def _caller_language(flow_manager: FlowManager) -> str:
@@ -286,12 +281,10 @@ async def system_phone_number(
 
     status = status_helper(is_valid)
     result = dict(status=status.value, phone_number=validated_caller_id_phone_number)
-    next_node = NodeConfig(
-        {
-            **prompts.get("record_language"),
-            "functions": [record_language],
-        }
-    )
+    next_node = {
+        **prompts.get("record_language"),
+        "functions": [record_language],
+    }
     return result, next_node
 
 
@@ -317,15 +310,13 @@ async def record_language(
     )
 
     result = LanguageResult(status=Status.SUCCESS, language=language)
-    next_node = NodeConfig(
-        {
-            **prompts.get(
-                "record_phone_number",
-                phone_number=flow_manager.state.get("phone"),
-            ),
-            "functions": [record_phone_number],
-        }
-    )
+    next_node = {
+        **prompts.get(
+            "record_phone_number",
+            phone_number=flow_manager.state.get("phone"),
+        ),
+        "functions": [record_phone_number],
+    }
     return result, next_node
 
 
@@ -352,16 +343,14 @@ async def record_phone_number(
     )
 
     if status == Status.SUCCESS:
-        next_node = NodeConfig(
-            node_partial_reset_with_summary()
-            | {
-                **prompts.get(
-                    "record_phone_type",
-                    phone_number=validated_phone_number,
-                ),
-                "functions": [record_phone_type],
-            }
-        )
+        next_node = {
+            **_PARTIAL_RESET_NODE,
+            **prompts.get(
+                "record_phone_type",
+                phone_number=validated_phone_number,
+            ),
+            "functions": [record_phone_type],
+        }
     else:
         if not is_valid:
             result.error = "Not a valid US phone number"
@@ -405,13 +394,11 @@ async def record_phone_type(
         phone_number=phone_number,
         phone_type=validated_phone_type,
     )
-    next_node = NodeConfig(
-        node_partial_reset_with_summary()
-        | {
-            **prompts.get("record_name"),
-            "functions": [record_name],
-        }
-    )
+    next_node = {
+        **_PARTIAL_RESET_NODE,
+        **prompts.get("record_name"),
+        "functions": [record_name],
+    }
     return result, next_node
 
 
@@ -448,13 +435,11 @@ async def record_name(
         return result, None
 
     result = CallerNamesResult(status=Status.SUCCESS, names=[name_validated])
-    next_node = NodeConfig(
-        node_partial_reset_with_summary()
-        | {
-            **prompts.get("record_service_area"),
-            "functions": [record_service_area],
-        }
-    )
+    next_node = {
+        **_PARTIAL_RESET_NODE,
+        **prompts.get("record_service_area"),
+        "functions": [record_service_area],
+    }
     return result, next_node
 
 
@@ -481,23 +466,20 @@ async def record_service_area(
     )
 
     if status == Status.SUCCESS:
-        next_node = NodeConfig(
-            node_partial_reset_with_summary()
-            | {
-                **prompts.get("record_case_type"),
-                "functions": [record_case_type],
-            }
-        )
+        next_node = {
+            **_PARTIAL_RESET_NODE,
+            **prompts.get("record_case_type"),
+            "functions": [record_case_type],
+        }
+    elif match:
+        result.error = f"""No exact match found. Maybe you meant {match}?"""
+        next_node = None
     else:
-        if match:
-            result.error = f"""No exact match found. Maybe you meant {match}?"""
-            next_node = None
-        else:
-            result.error = (
-                "I couldn't identify a Virginia city or county from that response. "
-                "Ask the caller again for only the city or county where the legal incident occurred."
-            )
-            next_node = None
+        result.error = (
+            "I couldn't identify a Virginia city or county from that response. "
+            "Ask the caller again for only the city or county where the legal incident occurred."
+        )
+        next_node = None
     return result, next_node
 
 
@@ -512,7 +494,7 @@ async def record_case_type(
         case_description (str): The description of the legal case that the caller has.
     """
     case_response = await validator.check_case_type(case_description=case_description)
-    logger.debug(f"""case_response: {case_response}""")
+    logger.debug("case_response: {}", case_response)
 
     # Check if we need to ask follow-up questions
     if case_response.follow_up_questions:
@@ -537,22 +519,18 @@ async def record_case_type(
         case_description=case_description,
     )
     if status == Status.SUCCESS:
-        next_node = NodeConfig(
-            node_partial_reset_with_summary()
-            | {
-                **prompts.get("record_adverse_parties"),
-                "functions": [record_adverse_parties],
-            }
-        )
+        next_node = {
+            **_PARTIAL_RESET_NODE,
+            **prompts.get("record_adverse_parties"),
+            "functions": [record_adverse_parties],
+        }
     else:
         result.error = "Ineligible case type."
-        next_node = NodeConfig(
-            node_partial_reset_with_summary()
-            | {
-                **prompts.get("case_type_ineligible"),
-                "functions": [send_case_type_referral_and_end],
-            }
-        )
+        next_node = {
+            **_PARTIAL_RESET_NODE,
+            **prompts.get("case_type_ineligible"),
+            "functions": [send_case_type_referral_and_end],
+        }
     return result, next_node
 
 
@@ -616,13 +594,11 @@ async def record_adverse_parties(
         status=Status.SUCCESS,
         adverse_parties=adverse_parties_validated,
     )
-    next_node = NodeConfig(
-        node_partial_reset_with_summary()
-        | {
-            **prompts.get("record_domestic_violence"),
-            "functions": [record_domestic_violence],
-        }
-    )
+    next_node = {
+        **_PARTIAL_RESET_NODE,
+        **prompts.get("record_domestic_violence"),
+        "functions": [record_domestic_violence],
+    }
     return result, next_node
 
 
@@ -641,13 +617,11 @@ async def record_domestic_violence(
         is_experiencing=is_experiencing,
     )
 
-    next_node = NodeConfig(
-        node_partial_reset_with_summary()
-        | {
-            **prompts.get("record_household_composition"),
-            "functions": [record_household_composition],
-        }
-    )
+    next_node = {
+        **_PARTIAL_RESET_NODE,
+        **prompts.get("record_household_composition"),
+        "functions": [record_household_composition],
+    }
     return result, next_node
 
 
@@ -678,13 +652,11 @@ async def record_household_composition(
         number_of_adults=number_of_adults,
         number_of_children=number_of_children,
     )
-    next_node = NodeConfig(
-        node_partial_reset_with_summary()
-        | {
-            **prompts.get("record_income"),
-            "functions": [record_income],
-        }
-    )
+    next_node = {
+        **_PARTIAL_RESET_NODE,
+        **prompts.get("record_income"),
+        "functions": [record_income],
+    }
     return result, next_node
 
 
@@ -738,22 +710,18 @@ async def record_income(
         household_size=household_size,
     )
     if status == Status.SUCCESS:
-        next_node = NodeConfig(
-            node_partial_reset_with_summary()
-            | {
-                **prompts.get("record_assets_receives_benefits"),
-                "functions": [record_assets_receives_benefits],
-            }
-        )
+        next_node = {
+            **_PARTIAL_RESET_NODE,
+            **prompts.get("record_assets_receives_benefits"),
+            "functions": [record_assets_receives_benefits],
+        }
     else:
         result.error = """Over the household income limit"""
-        next_node = NodeConfig(
-            node_partial_reset_with_summary()
-            | {
-                **prompts.get("confirm_income_over_limit"),
-                "functions": [continue_intake, send_over_limit_referral_and_end],
-            }
-        )
+        next_node = {
+            **_PARTIAL_RESET_NODE,
+            **prompts.get("confirm_income_over_limit"),
+            "functions": [continue_intake, send_over_limit_referral_and_end],
+        }
     return result, next_node
 
 
@@ -767,8 +735,8 @@ async def record_assets_receives_benefits(
     Args:
         receives_benefits (bool): The caller has receives government benefits.
     """
+    IntakeValidator.assets_clear_partial_state(flow_manager.state)
     if receives_benefits:
-        IntakeValidator.assets_clear_partial_state(flow_manager.state)
         result = AssetsResult(
             status=Status.SUCCESS,
             is_eligible=True,
@@ -776,23 +744,18 @@ async def record_assets_receives_benefits(
             total_value=0,
             receives_benefits=True,
         )
-        next_node = NodeConfig(
-            node_partial_reset_with_summary()
-            | {
-                **prompts.get("record_citizenship"),
-                "functions": [record_citizenship],
-            }
-        )
+        next_node = {
+            **_PARTIAL_RESET_NODE,
+            **prompts.get("record_citizenship"),
+            "functions": [record_citizenship],
+        }
     else:
-        IntakeValidator.assets_clear_partial_state(flow_manager.state)
         result = None
-        next_node = NodeConfig(
-            node_partial_reset_with_summary()
-            | {
-                **prompts.get("record_assets_cash_accounts"),
-                "functions": [record_assets_cash_accounts],
-            }
-        )
+        next_node = {
+            **_PARTIAL_RESET_NODE,
+            **prompts.get("record_assets_cash_accounts"),
+            "functions": [record_assets_cash_accounts],
+        }
     return result, next_node
 
 
@@ -808,13 +771,11 @@ async def record_assets_cash_accounts(
         return _asset_validation_error_result(e), None
 
     result = AssetCategoryResult(status=Status.SUCCESS, listing=assets_validated)
-    next_node = NodeConfig(
-        node_partial_reset_with_summary()
-        | {
-            **prompts.get("record_assets_investments"),
-            "functions": [record_assets_investments],
-        }
-    )
+    next_node = {
+        **_PARTIAL_RESET_NODE,
+        **prompts.get("record_assets_investments"),
+        "functions": [record_assets_investments],
+    }
     return result, next_node
 
 
@@ -830,13 +791,11 @@ async def record_assets_investments(
         return _asset_validation_error_result(e), None
 
     result = AssetCategoryResult(status=Status.SUCCESS, listing=assets_validated)
-    next_node = NodeConfig(
-        node_partial_reset_with_summary()
-        | {
-            **prompts.get("record_assets_other_property"),
-            "functions": [record_assets_other_property],
-        }
-    )
+    next_node = {
+        **_PARTIAL_RESET_NODE,
+        **prompts.get("record_assets_other_property"),
+        "functions": [record_assets_other_property],
+    }
     return result, next_node
 
 
@@ -857,18 +816,14 @@ async def record_assets_other_property(
         overrides={"assets_other_property": current_assets},
     )
     result = AssetCategoryResult(status=Status.SUCCESS, listing=assets_validated)
-    next_node = NodeConfig(
-        node_partial_reset_with_summary()
-        | {
-            **prompts.get(
-                "record_assets_list",
-                current_assets_summary=IntakeValidator.assets_prompt_text(
-                    merged_assets
-                ),
-            ),
-            "functions": [record_assets_list],
-        }
-    )
+    next_node = {
+        **_PARTIAL_RESET_NODE,
+        **prompts.get(
+            "record_assets_list",
+            current_assets_summary=IntakeValidator.assets_prompt_text(merged_assets),
+        ),
+        "functions": [record_assets_list],
+    }
     return result, next_node
 
 
@@ -919,22 +874,18 @@ async def record_assets_list(
     )
     IntakeValidator.assets_clear_partial_state(flow_manager.state)
     if status == Status.SUCCESS:
-        next_node = NodeConfig(
-            node_partial_reset_with_summary()
-            | {
-                **prompts.get("record_citizenship"),
-                "functions": [record_citizenship],
-            }
-        )
+        next_node = {
+            **_PARTIAL_RESET_NODE,
+            **prompts.get("record_citizenship"),
+            "functions": [record_citizenship],
+        }
     else:
         result.error = "Over the household assets' value limit."
-        next_node = NodeConfig(
-            node_partial_reset_with_summary()
-            | {
-                **prompts.get("confirm_assets_over_limit"),
-                "functions": [continue_intake, send_over_limit_referral_and_end],
-            }
-        )
+        next_node = {
+            **_PARTIAL_RESET_NODE,
+            **prompts.get("confirm_assets_over_limit"),
+            "functions": [continue_intake, send_over_limit_referral_and_end],
+        }
     return result, next_node
 
 
@@ -961,13 +912,11 @@ async def record_citizenship(
         return result, None
 
     result = CitizenshipResult(status=Status.SUCCESS, is_citizen=is_a_us_citizen)
-    next_node = NodeConfig(
-        node_partial_reset_with_summary()
-        | {
-            **prompts.get("record_ssn_last_4"),
-            "functions": [record_ssn_last_4],
-        }
-    )
+    next_node = {
+        **_PARTIAL_RESET_NODE,
+        **prompts.get("record_ssn_last_4"),
+        "functions": [record_ssn_last_4],
+    }
     return result, next_node
 
 
@@ -1020,13 +969,11 @@ async def record_ssn_last_4(
     )
 
     if status == Status.SUCCESS:
-        next_node = NodeConfig(
-            node_partial_reset_with_summary()
-            | {
-                **prompts.get("record_date_of_birth"),
-                "functions": [record_date_of_birth],
-            }
-        )
+        next_node = {
+            **_PARTIAL_RESET_NODE,
+            **prompts.get("record_date_of_birth"),
+            "functions": [record_date_of_birth],
+        }
     else:
         result.error = (
             "Invalid SSN. Please provide the last 4 digits in format: XXXX or XXX-X."
@@ -1061,13 +1008,11 @@ async def record_date_of_birth(
     )
 
     if status == Status.SUCCESS:
-        next_node = NodeConfig(
-            node_partial_reset_with_summary()
-            | {
-                **prompts.get("record_names"),
-                "functions": [record_names],
-            }
-        )
+        next_node = {
+            **_PARTIAL_RESET_NODE,
+            **prompts.get("record_names"),
+            "functions": [record_names],
+        }
     else:
         result.error = "Invalid date of birth. Please provide a date in the format MM/DD/YYYY or similar."
         next_node = None
@@ -1127,13 +1072,11 @@ async def record_names(
         return result, None
 
     result = CallerNamesResult(status=Status.SUCCESS, names=names_validated)
-    next_node = NodeConfig(
-        node_partial_reset_with_summary()
-        | {
-            **prompts.get("record_address"),
-            "functions": [record_address],
-        }
-    )
+    next_node = {
+        **_PARTIAL_RESET_NODE,
+        **prompts.get("record_address"),
+        "functions": [record_address],
+    }
     return result, next_node
 
 
@@ -1160,46 +1103,35 @@ async def record_address(
 
         Note: All fields can be empty if the caller refuses or does not have an address.
     """
-    # Check if all required fields are empty
-    if not any([street, city, state, zip, county]):
-        result = AddressResult(status=Status.SUCCESS, address=None)
-        next_node = NodeConfig(
-            node_partial_reset_with_summary()
-            | {
-                **prompts.get("complete_intake"),
-                "post_actions": [{"type": "end_conversation"}],
-            }
-        )
-        return result, next_node
-
-    try:
-        address_validated = Address.model_validate(
-            {
-                "street": street,
-                "street_2": street_2,
-                "city": city,
-                "state": state,
-                "zip": zip,
-                "county": county,
-            }
-        )
-    except ValidationError as e:
-        logger.debug(e)
-        cleaned_error = clean_pydantic_error_message(e)
-        result = IntakeFlowResult(
-            status=Status.ERROR,
-            error=f"""There was an error validating the `address`: {cleaned_error}.""",
-        )
-        return result, None
+    # Only validate if the caller gave an address; all required fields empty means no address
+    address_validated = None
+    if any([street, city, state, zip, county]):
+        try:
+            address_validated = Address.model_validate(
+                {
+                    "street": street,
+                    "street_2": street_2,
+                    "city": city,
+                    "state": state,
+                    "zip": zip,
+                    "county": county,
+                }
+            )
+        except ValidationError as e:
+            logger.debug(e)
+            cleaned_error = clean_pydantic_error_message(e)
+            result = IntakeFlowResult(
+                status=Status.ERROR,
+                error=f"""There was an error validating the `address`: {cleaned_error}.""",
+            )
+            return result, None
 
     result = AddressResult(status=Status.SUCCESS, address=address_validated)
-    next_node = NodeConfig(
-        node_partial_reset_with_summary()
-        | {
-            **prompts.get("complete_intake"),
-            "post_actions": [{"type": "end_conversation"}],
-        }
-    )
+    next_node = {
+        **_PARTIAL_RESET_NODE,
+        **prompts.get("complete_intake"),
+        "post_actions": [{"type": "end_conversation"}],
+    }
     return result, next_node
 
 
@@ -1217,19 +1149,13 @@ async def continue_intake(
     Args:
         next_step (str): The next step of the intake.
     """
-    # Dynamically reference the function using the next_step string
-    try:
-        next_function = getattr(sys.modules[__name__], next_step)
-    except AttributeError:
-        raise ValueError(f"""Function '{next_step}' does not exist.""")
-
-    next_node = NodeConfig(
-        node_partial_reset_with_summary()
-        | {
-            **prompts.get(next_step),
-            "functions": [next_function],
-        }
-    )
+    next_function = _flow_function(next_step)
+
+    next_node = {
+        **_PARTIAL_RESET_NODE,
+        **prompts.get(next_step),
+        "functions": [next_function],
+    }
     return None, next_node
 
 
@@ -1331,3 +1257,34 @@ def node_caller_ended_conversation() -> NodeConfig:
         "functions": [],
         "post_actions": [{"type": "end_conversation"}],
     }
+
+
+# Flow functions that can be selected by name, e.g. by `continue_intake` or the
+# TEST_INITIAL_FUNCTION environment variable.
+_FLOW_FUNCTIONS = {
+    function.__name__: function
+    for function in (
+        system_phone_number,
+        record_language,
+        record_phone_number,
+        record_phone_type,
+        record_name,
+        record_service_area,
+        record_case_type,
+        record_adverse_parties,
+        record_domestic_violence,
+        record_household_composition,
+        record_income,
+        record_assets_receives_benefits,
+        record_assets_cash_accounts,
+        record_assets_investments,
+        record_assets_other_property,
+        record_assets_list,
+        record_citizenship,
+        record_ssn_last_4,
+        record_date_of_birth,
+        record_names,
+        record_address,
+        end_conversation,
+    )
+}
@@ -12,6 +12,10 @@ from loguru import logger
 from pipecat_flows import FlowManager
 from pydantic import BaseModel, ValidationError
 
+_PYDANTIC_ERROR_URL_RE = re.compile(
+    r"""\n\s*For further information visit https://[^\s]+"""
+)
+
 
 def clean_pydantic_error_message(error: ValidationError) -> str:
     """
@@ -28,11 +32,11 @@ def clean_pydantic_error_message(error: ValidationError) -> str:
         0.phones.0.number
           Value error, Invalid US phone number: 111-111-1111 [type=value_error, input_value='111-111-1111', input_type=str]"
     """
-    error_message = str(error)
-    cleaned = re.sub(
-        r"""\n\s*For further information visit https://[^\s]+""", "", error_message
-    )
-    return cleaned
+    return _PYDANTIC_ERROR_URL_RE.sub("", str(error))
+
+
+# Fields returned to the LLM but not stored in the flow state.
+_RESULT_ONLY_FIELDS = frozenset({"status", "error"})
 
 
 def convert_and_log_result(state_key: str):
@@ -41,12 +45,14 @@ def convert_and_log_result(state_key: str):
         async def wrapper(flow_manager, *args, **kwargs):
             result, next_node = await func(flow_manager, *args, **kwargs)
             if isinstance(result, BaseModel):
-                flow_manager.state[state_key] = result.model_dump(
-                    exclude={"status", "error"}, exclude_none=True, mode="json"
-                )
+                result = result.model_dump(exclude_none=True, mode="json")
+                flow_manager.state[state_key] = {
+                    key: value
+                    for key, value in result.items()
+                    if key not in _RESULT_ONLY_FIELDS
+                }
                 if DEBUG:
                     log_flow_manager_state(flow_manager)
-                result = result.model_dump(exclude_none=True, mode="json")
             return result, next_node
 
         return wrapper
@@ -71,17 +77,26 @@ def _serialize_for_logging(value):
 
 
 def log_flow_manager_state(flow_manager: FlowManager):
-    logger.debug("----------------------------------------")
-    logger.debug("flow_manager.state:")
-    for key, value in flow_manager.state.items():
+    # Only walk and format the state if a sink will accept the debug record.
+    logger.opt(lazy=True).debug(
+        "{}", lambda: _format_flow_manager_state(flow_manager.state)
+    )
+
+
+def _format_flow_manager_state(state: dict) -> str:
+    lines = ["----------------------------------------", "flow_manager.state:"]
+    for key, value in state.items():
         serialized_value = _serialize_for_logging(value)
         if isinstance(serialized_value, dict):
-            logger.debug(f"""{key}:""")
-            for sub_key, sub_value in serialized_value.items():
-                logger.debug(f"""  {sub_key}: {sub_value}""")
+            lines.append(f"""{key}:""")
+            lines.extend(
+                f"""  {sub_key}: {sub_value}"""
+                for sub_key, sub_value in serialized_value.items()
+            )
         else:
-            logger.debug(f"""{key}: {serialized_value}""")
-    logger.debug("----------------------------------------")
+            lines.append(f"""{key}: {serialized_value}""")
+    lines.append("----------------------------------------")
+    return "\n".join(lines)
 
 
 _save_state_lock = asyncio.Lock()
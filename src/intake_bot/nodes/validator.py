@@ -1,7 +1,9 @@
 import re
 from datetime import datetime
 from enum import Enum
+from functools import cached_property, lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import yaml
 from intake_bot.models.classifier import ClassificationResponse
@@ -13,18 +15,21 @@ from intake_bot.models.validator import (
     InvestmentAssets,
     OtherPropertyAssets,
 )
-from intake_bot.services.classifier import Classifier
 from intake_bot.services.phonenumber import phone_number_is_valid
 from intake_bot.services.poverty import poverty_scale_income_qualifies
 from intake_bot.services.reference_data import ReferenceDataLoader
 from intake_bot.utils.globals import DATA_DIR
+from intake_bot.utils.yaml_loader import YAML_LOADER
 from rapidfuzz import fuzz, process, utils
 
+if TYPE_CHECKING:
+    from intake_bot.services.classifier import Classifier
+
 
 def _load_asset_exemptions() -> tuple[frozenset[str], frozenset[str]]:
     path = Path(DATA_DIR) / "asset_exemptions.yml"
     with open(path) as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=YAML_LOADER)
     return (
         frozenset(data.get("single_words", [])),
         frozenset(data.get("phrases", [])),
@@ -55,13 +60,48 @@ class IntakeValidator:
         AssetCategory.OTHER_PROPERTY: OtherPropertyAssets,
     }
 
+    INCOME_PERIODS_PER_YEAR = {
+        IncomePeriod.ANNUALLY: 1,
+        IncomePeriod.MONTHLY: 12,
+        IncomePeriod.WEEKLY: 52,
+        IncomePeriod.BIWEEKLY: 26,
+        IncomePeriod.SEMI_MONTHLY: 24,
+        IncomePeriod.QUARTERLY: 4,
+    }
+
     ASSET_EXEMPT_SINGLE_WORDS, ASSET_EXEMPT_PHRASES = _load_asset_exemptions()
 
     def __init__(self):
         reference_data = ReferenceDataLoader()
         self.service_areas = reference_data.service_areas
         self.service_area_aliases = reference_data.service_area_aliases
-        self.classifier = Classifier()
+        # Compiled once for finding aliases embedded in longer phrases.
+        self.service_area_alias_patterns = [
+            (re.compile(rf"""\b{re.escape(alias)}\b"""), alias, match_data)
+            for alias, match_data in self.service_area_aliases.items()
+        ]
+        # Fuzzy matching compares against processed names, so process them once.
+        self.service_area_names = list(self.service_areas)
+        self.service_area_names_processed = [
+            utils.default_process(name) for name in self.service_area_names
+        ]
+        # Callers often repeat or confirm the same location, so remember matches.
+        self._match_service_area = lru_cache(maxsize=1024)(
+            self._match_service_area_uncached
+        )
+
+    @cached_property
+    def classifier(self) -> "Classifier":
+        """
+        The case type classifier, created on first use.
+
+        Building it loads the classifier prompts and taxonomy and creates the
+        provider clients, which is only needed once a case type is checked.
+        The module itself pulls in the OpenAI SDK, so it is imported here too.
+        """
+        from intake_bot.services.classifier import Classifier
+
+        return Classifier()
 
     @classmethod
     def assets_validate(
@@ -264,19 +304,27 @@ class IntakeValidator:
         Returns:
             tuple[str, int]: (matched_location, fips_code) where fips_code is 0 if no match found
         """
+        return self._match_service_area(location)
+
+    def _match_service_area_uncached(self, location: str) -> tuple[str, int]:
         normalized_location = ReferenceDataLoader._normalize_service_area_text(location)
         if not normalized_location:
             return "", 0
 
-        alias_match = self.service_area_aliases.get(normalized_location)
+        # Punctuation-only differences, such as "Amelia County." or
+        # "Isle-of-Wight", still hit the aliases once processed like the choices.
+        processed_location = utils.default_process(location)
+        alias_match = self.service_area_aliases.get(
+            normalized_location
+        ) or self.service_area_aliases.get(processed_location)
         if alias_match:
             return alias_match
 
         embedded_alias_match = max(
             (
                 (alias, match_data)
-                for alias, match_data in self.service_area_aliases.items()
-                if re.search(rf"""\b{re.escape(alias)}\b""", normalized_location)
+                for pattern, alias, match_data in self.service_area_alias_patterns
+                if pattern.search(normalized_location)
             ),
             key=lambda item: len(item[0]),
             default=None,
@@ -285,15 +333,14 @@ class IntakeValidator:
             return embedded_alias_match[1]
 
         match = process.extractOne(
-            location,
-            self.service_areas.keys(),
+            processed_location,
+            self.service_area_names_processed,
             scorer=fuzz.WRatio,
             score_cutoff=50,
-            processor=utils.default_process,
         )
 
         if match:
-            matched_location = match[0]
+            matched_location = self.service_area_names[match[2]]
             fips_code = self.service_areas.get(matched_location, 0)
             return matched_location, fips_code
         else:
@@ -317,25 +364,16 @@ class IntakeValidator:
         """
         Check the caller's income eligibility.
         """
-        total_monthly_income = 0.0
-        for member_income in income.root.values():
-            for income_detail in member_income.root.values():
-                amt = income_detail.amount
-                period = income_detail.period
-                if period == IncomePeriod.ANNUALLY:
-                    total_monthly_income += amt / 12
-                elif period == IncomePeriod.MONTHLY:
-                    total_monthly_income += amt
-                elif period == IncomePeriod.WEEKLY:
-                    total_monthly_income += (amt * 52) / 12
-                elif period == IncomePeriod.BIWEEKLY:
-                    total_monthly_income += (amt * 26) / 12
-                elif period == IncomePeriod.SEMI_MONTHLY:
-                    total_monthly_income += amt * 2
-                elif period == IncomePeriod.QUARTERLY:
-                    total_monthly_income += (amt * 4) / 12
-                else:
-                    raise ValueError(f"""Unknown period: {period}""")
+        try:
+            total_monthly_income = sum(
+                income_detail.amount
+                * self.INCOME_PERIODS_PER_YEAR[income_detail.period]
+                / 12
+                for member_income in income.root.values()
+                for income_detail in member_income.root.values()
+            )
+        except KeyError as e:
+            raise ValueError(f"""Unknown period: {e.args[0]}""") from None
         total_monthly_income = int(total_monthly_income)
         if household_size is None or household_size < 1:
             household_size = max(len(income.root.keys()), 1)
@@ -358,14 +396,14 @@ class IntakeValidator:
         """
         vlas_assets_limit: int = 10_000
 
-        total_value = 0
         countable_assets = self.assets_filter_countable_entries(
             [asset_entry.root for asset_entry in assets.root]
         )
-        for asset_entry in countable_assets:
-            for value in asset_entry.values():
-                total_value += int(value)
-        assets_value: int = int(total_value)
+        assets_value: int = sum(
+            int(value)
+            for asset_entry in countable_assets
+            for value in asset_entry.values()
+        )
         is_eligible: bool = vlas_assets_limit >= assets_value
         return is_eligible, assets_value
 
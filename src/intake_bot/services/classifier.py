@@ -17,6 +17,7 @@ from intake_bot.models.classifier import (
 from intake_bot.services.reference_data import ReferenceDataLoader
 from intake_bot.utils.ev import require_ev
 from intake_bot.utils.globals import DATA_DIR, DEBUG
+from intake_bot.utils.yaml_loader import YAML_LOADER
 from loguru import logger
 from openai import AsyncAzureOpenAI
 from rapidfuzz import fuzz, process, utils
@@ -33,7 +34,7 @@ class Classifier:
     def _load_prompts() -> Dict[str, str]:
         prompts_file = Path(DATA_DIR) / "classifier_prompts.yml"
         with open(prompts_file) as f:
-            prompts_data: Dict[str, str] = yaml.safe_load(f)
+            prompts_data: Dict[str, str] = yaml.load(f, Loader=YAML_LOADER)
         return prompts_data
 
     @staticmethod
@@ -44,6 +45,10 @@ class Classifier:
         # Load data from files
         self.prompts = Classifier._load_prompts()
         self.taxonomy = Classifier._load_taxonomy()
+        # The taxonomy is fixed for the classifier's lifetime, so build the
+        # label list and the prompt that embeds it once.
+        self.taxonomy_labels = list(self.taxonomy)
+        self.final_prompt = self.load_prompt(self.taxonomy_labels)
 
         # Follow-up threshold: ask follow-up questions if confidence is below this
         self.follow_up_threshold = 0.70
@@ -63,6 +68,7 @@ class Classifier:
         ]
 
         self.providers = self._init_providers()
+        self._merge_provider: Optional["Classifier.AzureOpenAIProvider"] = None
 
     def load_prompt(self, taxonomy: List[str]) -> str:
         """Load and render a prompt template for a provider.
@@ -119,6 +125,23 @@ class Classifier:
 
         return filtered_providers
 
+    def _get_merge_provider(self) -> "Classifier.AzureOpenAIProvider":
+        """Return the provider used to merge follow-up questions.
+
+        Reuses the enabled gpt-4.1-mini provider when there is one, so the
+        merge call shares its client and connection pool instead of opening
+        a new one on every classification.
+        """
+        for provider in self.providers:
+            if (
+                isinstance(provider, self.AzureOpenAIProvider)
+                and provider.model_name == "gpt-4.1-mini"
+            ):
+                return provider
+        if self._merge_provider is None:
+            self._merge_provider = self.AzureOpenAIProvider(model_name="gpt-4.1-mini")
+        return self._merge_provider
+
     async def _semantically_merge_questions(
         self, questions: List[FollowUpQuestion]
     ) -> List[FollowUpQuestion]:
@@ -136,7 +159,7 @@ class Classifier:
         questions_data = [q.model_dump() for q in questions]
         questions_json = json.dumps(questions_data, indent=2)
 
-        provider = self.AzureOpenAIProvider(model_name="gpt-4.1-mini")
+        provider = self._get_merge_provider()
 
         try:
 
@@ -396,13 +419,11 @@ class Classifier:
 
         # Run providers in parallel
         tasks = []
-        taxonomy_keys = list(taxonomy.keys())
-        final_prompt = self.load_prompt(taxonomy_keys)
         for provider in self.providers:
             provider_kwargs = {
                 "problem_description": problem_description,
-                "prompt": final_prompt,
-                "taxonomy": taxonomy_keys,
+                "prompt": self.final_prompt,
+                "taxonomy": self.taxonomy_labels,
             }
             # Add reasoning_effort if provider has it set
             if provider.reasoning_effort:
@@ -756,21 +777,8 @@ class Classifier:
     class KeywordProvider(Provider):
         """Simple keyword-based provider."""
 
-        def __init__(self):
-            """Initialize keyword provider."""
-            super().__init__("keyword")
-
-        async def classify(
-            self, problem_description: str, taxonomy: List[str], **kwargs
-        ) -> Dict[str, Any]:
-            """Classify using fuzzy keyword matching with rapidfuzz.
-
-            Combines fuzzy string matching with direct word matching to find
-            relevant legal categories from the problem description.
-            """
-            if taxonomy is None:
-                return {"labels": [], "questions": []}
-            words_to_ignore = {
+        WORDS_TO_IGNORE = frozenset(
+            {
                 "the",
                 "a",
                 "an",
@@ -812,22 +820,36 @@ class Classifier:
                 "may",
                 "will",
                 "just",
-                "been",
                 "being",
-                "been",
                 "be",
                 "he",
                 "she",
                 "we",
                 "they",
             }
+        )
+
+        def __init__(self):
+            """Initialize keyword provider."""
+            super().__init__("keyword")
+
+        async def classify(
+            self, problem_description: str, taxonomy: List[str], **kwargs
+        ) -> Dict[str, Any]:
+            """Classify using fuzzy keyword matching with rapidfuzz.
+
+            Combines fuzzy string matching with direct word matching to find
+            relevant legal categories from the problem description.
+            """
+            if taxonomy is None:
+                return {"labels": [], "questions": []}
 
             words = problem_description.lower().split()
             key_terms = set(
                 w.rstrip(".,!?;:()[]{}").lower()
                 for w in words
                 if len(w) > 3
-                and w.rstrip(".,!?;:()[]{}").lower() not in words_to_ignore
+                and w.rstrip(".,!?;:()[]{}").lower() not in self.WORDS_TO_IGNORE
             )
             key_phrase = " ".join(
                 sorted(key_terms)
@@ -7,6 +7,7 @@ import aiohttp
 import yaml
 from intake_bot.utils.ev import get_ev
 from intake_bot.utils.globals import DATA_DIR
+from intake_bot.utils.yaml_loader import YAML_LOADER
 
 
 @dataclass(frozen=True)
@@ -33,7 +34,7 @@ class ReferralContent:
 def _load_referral_content(path: Path | None = None) -> dict[str, ReferralContent]:
     referral_path = path or (Path(DATA_DIR) / "referral_content.yml")
     with open(referral_path, encoding="utf-8") as handle:
-        raw_content: dict[str, dict[str, str]] = yaml.safe_load(handle)
+        raw_content: dict[str, dict[str, str]] = yaml.load(handle, Loader=YAML_LOADER)
 
     return {key: ReferralContent(**value) for key, value in raw_content.items()}
 
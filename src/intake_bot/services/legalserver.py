@@ -80,7 +80,7 @@ async def save_intake_legalserver(state: dict):
                     "lookup_value_name"
                 )
 
-            logger.debug(f"""Matter payload: {payload}""")
+            logger.debug("Matter payload: {}", payload)
 
             matter_response = await session.post(
                 f"""{LEGALSERVER_API_BASE_URL}/matters""",
@@ -111,30 +111,48 @@ async def save_intake_legalserver(state: dict):
             else:
                 logger.debug(f"""Matter created successfully: {matter_uuid}""")
 
+            # The child records only depend on the matter, so write them concurrently.
+            child_saves = []
+
             if "income" in state:
-                await _save_income_records(session, matter_uuid, state["income"])
+                child_saves.append(
+                    _save_income_records(session, matter_uuid, state["income"])
+                )
 
             if "adverse_parties" in state:
-                await _save_adverse_parties(
-                    session, matter_uuid, state["adverse_parties"]
+                child_saves.append(
+                    _save_adverse_parties(
+                        session, matter_uuid, state["adverse_parties"]
+                    )
                 )
 
             if "case_type" in state:
-                await _save_case_description_note(
-                    session, matter_uuid, state["case_type"]
+                child_saves.append(
+                    _save_case_description_note(
+                        session, matter_uuid, state["case_type"]
+                    )
                 )
 
             if "assets" in state:
-                await _save_assets_note(session, matter_uuid, state["assets"])
+                child_saves.append(
+                    _save_assets_note(session, matter_uuid, state["assets"])
+                )
 
             if "names" in state and "names" in state["names"]:
                 if len(state["names"]["names"]) > 1:
-                    await _save_additional_names(
-                        session, matter_uuid, state["names"]["names"]
+                    child_saves.append(
+                        _save_additional_names(
+                            session, matter_uuid, state["names"]["names"]
+                        )
                     )
 
             if rejection_reason_name:
-                await _save_rejection_note(session, matter_uuid, rejection_reason_name)
+                child_saves.append(
+                    _save_rejection_note(session, matter_uuid, rejection_reason_name)
+                )
+
+            # Each child save handles and logs its own failures.
+            await asyncio.gather(*child_saves)
 
     except aiohttp.ClientError as e:
         logger.error(f"""HTTP Request failed: {e}""")
@@ -461,59 +479,75 @@ async def _save_adverse_parties(
         logger.debug("No adverse parties to save")
         return
 
-    try:
-        for party in parties:
-            try:
-                # Extract base party data
-                payload_data = {
-                    "first": party.get("first"),
-                    "last": party.get("last"),
-                    "middle": party.get("middle"),
-                    "suffix": party.get("suffix"),
-                    "date_of_birth": party.get("dob"),
-                }
+    # Each party is a separate record, so post them concurrently. Every
+    # coroutine handles its own errors, so one bad party never blocks the rest.
+    await asyncio.gather(
+        *(_save_adverse_party(session, matter_uuid, party) for party in parties)
+    )
 
-                # Add phones if present - map from phones array to individual phone fields
-                phones = party.get("phones", [])
-                if phones:
-                    for phone in phones:
-                        phone_number = phone.get("number")
-                        phone_type = (phone.get("type") or "").lower()
-                        if phone_number and phone_type:
-                            # Map phone type to field name: phone_{type}
-                            field_name = f"""phone_{phone_type}"""
-                            payload_data[field_name] = phone_number
-
-                payload = AdversePartyPayload(**payload_data)
-            except ValidationError as e:
-                logger.warning(
-                    f"""Failed to validate adverse party for matter {matter_uuid}: {e}"""
-                )
-                continue
 
-            response = await session.post(
-                f"""{LEGALSERVER_API_BASE_URL}/matters/{matter_uuid}/adverse_parties""",
-                headers=LEGALSERVER_HEADERS,
-                json=payload.model_dump(exclude_none=True),
+async def _save_adverse_party(
+    session: aiohttp.ClientSession, matter_uuid: str, party: Dict[str, Any]
+) -> None:
+    """
+    Save a single adverse party, falling back to a note on API errors.
+
+    Args:
+        session: ClientSession for making HTTP requests
+        matter_uuid: The matter UUID from the matter creation response
+        party: Dictionary of adverse party data
+    """
+    try:
+        try:
+            # Extract base party data
+            payload_data = {
+                "first": party.get("first"),
+                "last": party.get("last"),
+                "middle": party.get("middle"),
+                "suffix": party.get("suffix"),
+                "date_of_birth": party.get("dob"),
+            }
+
+            # Add phones if present - map from phones array to individual phone fields
+            phones = party.get("phones", [])
+            if phones:
+                for phone in phones:
+                    phone_number = phone.get("number")
+                    phone_type = (phone.get("type") or "").lower()
+                    if phone_number and phone_type:
+                        # Map phone type to field name: phone_{type}
+                        field_name = f"""phone_{phone_type}"""
+                        payload_data[field_name] = phone_number
+
+            payload = AdversePartyPayload(**payload_data)
+        except ValidationError as e:
+            logger.warning(
+                f"""Failed to validate adverse party for matter {matter_uuid}: {e}"""
             )
+            return
 
-            if response.status not in (200, 201):
-                response_body = await response.text()
-                _log_child_write_failure(
-                    f"""Failed to save adverse party for matter {matter_uuid}""",
-                    response.status,
-                    response_body,
-                )
-                await _post_fallback_note(
-                    session,
-                    matter_uuid,
-                    f"""Adverse Party (API Error): {payload.first} {payload.last}""",
-                    _api_error_note_body(response.status, response_body, payload),
-                )
-            else:
-                _finalize_response(response)
-                logger.debug(f"""Adverse party created for matter {matter_uuid}""")
+        response = await session.post(
+            f"""{LEGALSERVER_API_BASE_URL}/matters/{matter_uuid}/adverse_parties""",
+            headers=LEGALSERVER_HEADERS,
+            json=payload.model_dump(exclude_none=True),
+        )
 
+        if response.status not in (200, 201):
+            response_body = await response.text()
+            _log_child_write_failure(
+                f"""Failed to save adverse party for matter {matter_uuid}""",
+                response.status,
+                response_body,
+            )
+            await _post_fallback_note(
+                session,
+                matter_uuid,
+                f"""Adverse Party (API Error): {payload.first} {payload.last}""",
+                _api_error_note_body(response.status, response_body, payload),
+            )
+        else:
+            _finalize_response(response)
+            logger.debug(f"""Adverse party created for matter {matter_uuid}""")
     except aiohttp.ClientError as e:
         logger.error(f"""HTTP Request failed while saving adverse parties: {e}""")
     except Exception:
@@ -591,36 +625,36 @@ async def _save_assets_note(
     listing = assets_data.get("listing", [])
     total_value = assets_data.get("total_value", 0)
 
-    if not listing and total_value == 0:
-        body = "No assets recorded"
-        try:
-            payload = NotePayload(
-                subject="Assets",
-                body=body,
-                note_type={"lookup_value_name": "General Notes"},
-            )
-        except Exception as e:
-            logger.warning(f"""Failed to validate assets note: {e}""")
-            return
-
-        response = await session.post(
-            f"""{LEGALSERVER_API_BASE_URL}/matters/{matter_uuid}/notes""",
-            headers=LEGALSERVER_HEADERS,
-            json=payload.model_dump(exclude_none=True),
-        )
+    try:
+        if not listing and total_value == 0:
+            body = "No assets recorded"
+            try:
+                payload = NotePayload(
+                    subject="Assets",
+                    body=body,
+                    note_type={"lookup_value_name": "General Notes"},
+                )
+            except Exception as e:
+                logger.warning(f"""Failed to validate assets note: {e}""")
+                return
 
-        if response.status not in (200, 201):
-            _log_child_write_failure(
-                "Failed to save assets note",
-                response.status,
-                await response.text(),
+            response = await session.post(
+                f"""{LEGALSERVER_API_BASE_URL}/matters/{matter_uuid}/notes""",
+                headers=LEGALSERVER_HEADERS,
+                json=payload.model_dump(exclude_none=True),
             )
-        else:
-            _finalize_response(response)
-            logger.debug("Assets note created: no assets recorded")
-        return
 
-    try:
+            if response.status not in (200, 201):
+                _log_child_write_failure(
+                    "Failed to save assets note",
+                    response.status,
+                    await response.text(),
+                )
+            else:
+                _finalize_response(response)
+                logger.debug("Assets note created: no assets recorded")
+            return
+
         asset_lines = []
 
         if listing:
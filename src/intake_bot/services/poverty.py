@@ -1,4 +1,5 @@
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Union
 
@@ -7,18 +8,27 @@ from intake_bot.utils.globals import DATA_DIR
 # vendored: https://github.com/SuffolkLITLab/docassemble-PovertyScale/commit/afbe6b1d5c445acbdf9cd95c388ad34cb21b40fe
 
 
+@lru_cache(maxsize=1)
 def get_poverty_scale_data() -> dict:
+    """
+    Load the federal poverty scale data once per process.
+
+    Callers must treat the returned dict as read-only, since it is shared.
+    """
     path = Path(DATA_DIR) / "federal_poverty_scale.json"
     with open(path) as f:
         ps_data: dict = json.load(f)
     return ps_data
 
 
+@lru_cache(maxsize=64)
 def poverty_scale_get_income_limit(
     household_size: int = 1, multiplier: float = 1.0, state=None
 ) -> Union[int, None]:
     """
     Return the income limit matching the given household size.
+
+    Cached per household size, multiplier, and state, since the data is fixed.
     """
     ps_data = get_poverty_scale_data()
     if not ps_data:
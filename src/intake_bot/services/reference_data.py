@@ -4,6 +4,7 @@ from typing import Dict, Optional
 
 import yaml
 from intake_bot.utils.globals import DATA_DIR
+from intake_bot.utils.yaml_loader import YAML_LOADER
 from loguru import logger
 
 
@@ -15,6 +16,7 @@ class ReferenceDataLoader:
 
     _instance = None
     _data: Optional[Dict] = None
+    _service_area_aliases: Optional[Dict[str, tuple[str, int]]] = None
 
     def __new__(cls):
         if cls._instance is None:
@@ -35,11 +37,13 @@ class ReferenceDataLoader:
                     f"""Reference data file not found: {ref_file}"""
                 )
             with open(ref_file) as f:
-                ReferenceDataLoader._data = yaml.safe_load(f)
+                ReferenceDataLoader._data = yaml.load(f, Loader=YAML_LOADER)
+            ReferenceDataLoader._service_area_aliases = None
             logger.debug(f"""Loaded reference data from {ref_file}""")
         except Exception as e:
             logger.error(f"""Error loading reference data from {ref_file}: {e}""")
             ReferenceDataLoader._data = {}
+            ReferenceDataLoader._service_area_aliases = None
 
     @staticmethod
     def _normalize_service_area_text(location: str) -> str:
@@ -71,7 +75,11 @@ class ReferenceDataLoader:
     @property
     def service_area_aliases(self) -> Dict[str, tuple[str, int]]:
         """Get normalized service-area aliases mapped to canonical names and FIPS codes."""
-        return self._build_service_area_aliases(self.service_areas)
+        if ReferenceDataLoader._service_area_aliases is None:
+            ReferenceDataLoader._service_area_aliases = (
+                self._build_service_area_aliases(self.service_areas)
+            )
+        return ReferenceDataLoader._service_area_aliases
 
     @property
     def income_categories(self) -> list[str]:
@@ -1,8 +1,8 @@
-from copy import deepcopy
 from pathlib import Path
 
 import yaml
 from intake_bot.utils.globals import DATA_DIR
+from intake_bot.utils.yaml_loader import YAML_LOADER
 
 
 class NodePrompts:
@@ -32,10 +32,15 @@ class NodePrompts:
     def __init__(self, default_role: str = "system"):
         path = Path(DATA_DIR) / "node_prompts.yml"
         self.prompts = self._load_prompts(path, default_role)
+        # Most prompts are requested without formatting arguments, so render
+        # those once up front and only copy them in `get`.
+        self._rendered = {
+            key: self._render(key, value) for key, value in self.prompts.items()
+        }
 
     def _load_prompts(self, path: Path, default_role: str) -> dict:
         with open(path) as f:
-            prompts: dict = yaml.safe_load(f)
+            prompts: dict = yaml.load(f, Loader=YAML_LOADER)
         for key, value in prompts.items():
             if isinstance(value, dict):
                 value["name"] = key
@@ -70,7 +75,12 @@ class NodePrompts:
         if key not in self.prompts:
             raise KeyError(f"""Prompt '{key}' not found.""")
 
-        prompt = deepcopy(self.prompts[key])
+        if kwargs:
+            return self._render(key, self.prompts[key], **kwargs)
+        return self._copy(self._rendered[key])
+
+    def _render(self, key: str, prompt: dict, **kwargs) -> dict:
+        prompt = self._copy(prompt)
 
         if "task_messages" in prompt:
             for task_message in prompt["task_messages"]:
@@ -85,6 +95,20 @@ class NodePrompts:
                         )
         return prompt
 
+    @classmethod
+    def _copy(cls, value):
+        """
+        Copy a prompt loaded from YAML.
+
+        Prompts only hold dicts, lists, and scalars, so this is a cheaper
+        equivalent of `copy.deepcopy` for them.
+        """
+        if isinstance(value, dict):
+            return {key: cls._copy(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [cls._copy(item) for item in value]
+        return value
+
     def _should_prepend_acknowledgment(self, key: str) -> bool:
         return key not in self.ACKNOWLEDGMENT_EXCLUDED_KEYS
 
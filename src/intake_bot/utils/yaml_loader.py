@@ -0,0 +1,5 @@
+import yaml
+
+# Prefer libyaml's loader when PyYAML was built with it; it parses the data
+# files roughly 20x faster than the pure-Python SafeLoader.
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
@@ -1,4 +1,11 @@
-from intake_bot.bot import AdaptiveIdleTimeout, IdleRetryHandler
+import asyncio
+
+import pytest
+from intake_bot.bot import (
+    AdaptiveIdleTimeout,
+    IdleRetryHandler,
+    install_eager_task_factory,
+)
 from pipecat.frames.frames import EndFrame, TTSSpeakFrame
 
 
@@ -85,3 +92,31 @@ def test_adaptive_idle_timeout_respects_maximum():
     very_long_prompt = " ".join(["word"] * 240)
 
     assert policy.timeout_for_content(very_long_prompt) == 25.0
+
+
+@pytest.mark.asyncio
+async def test_install_eager_task_factory_disabled(monkeypatch):
+    monkeypatch.setenv("ENABLE_EAGER_TASKS", "false")
+    loop = asyncio.get_running_loop()
+
+    install_eager_task_factory()
+
+    assert loop.get_task_factory() is None
+
+
+@pytest.mark.asyncio
+async def test_install_eager_task_factory_keeps_existing_factory(monkeypatch):
+    monkeypatch.setenv("ENABLE_EAGER_TASKS", "true")
+    loop = asyncio.get_running_loop()
+    try:
+        install_eager_task_factory()
+        assert loop.get_task_factory() is asyncio.eager_task_factory
+
+        def other_factory(loop, coro, **kwargs):
+            return asyncio.Task(coro, loop=loop, **kwargs)
+
+        loop.set_task_factory(other_factory)
+        install_eager_task_factory()
+        assert loop.get_task_factory() is other_factory
+    finally:
+        loop.set_task_factory(None)
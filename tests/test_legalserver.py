@@ -1277,6 +1277,45 @@ class TestSaveAdverseParties:
             await _save_adverse_parties(mock_client, "test-uuid", adverse_parties_data)
             mock_logger.exception.assert_called()
 
+    async def test_failed_adverse_party_does_not_block_others(self):
+        """Test that one failing adverse party save does not skip the rest."""
+        mock_client = AsyncMock()
+        mock_client.post = AsyncMock(
+            side_effect=[Exception("Connection error"), MagicMock(status=201)]
+        )
+
+        adverse_parties_data = {
+            "adverse_parties": [
+                {"first": "John", "last": "Doe"},
+                {"first": "Jane", "last": "Smith"},
+            ]
+        }
+
+        with patch("intake_bot.services.legalserver.logger") as mock_logger:
+            await _save_adverse_parties(mock_client, "test-uuid", adverse_parties_data)
+            mock_logger.exception.assert_called_once()
+
+        assert mock_client.post.call_count == 2
+
+    async def test_malformed_adverse_party_does_not_block_others(self):
+        """Test that a party whose payload cannot be built does not skip the rest."""
+        mock_client = AsyncMock()
+        mock_client.post = AsyncMock(return_value=MagicMock(status=201))
+
+        adverse_parties_data = {
+            "adverse_parties": [
+                {"first": "John", "last": "Doe", "phones": [None]},
+                {"first": "Jane", "last": "Smith"},
+            ]
+        }
+
+        with patch("intake_bot.services.legalserver.logger") as mock_logger:
+            await _save_adverse_parties(mock_client, "test-uuid", adverse_parties_data)
+            mock_logger.exception.assert_called_once()
+
+        mock_client.post.assert_called_once()
+        assert mock_client.post.call_args[1]["json"]["first"] == "Jane"
+
     async def test_successful_adverse_party_creation_logs_debug(self):
         """Test that successful adverse party creation is logged."""
         mock_client = AsyncMock()
@@ -1443,6 +1482,17 @@ class TestSaveAssetsNote:
             await _save_assets_note(mock_client, "test-uuid", assets_data)
             mock_logger.exception.assert_called()
 
+    async def test_handle_http_error_in_no_assets_note(self):
+        """Test that HTTP errors saving the no-assets note are handled."""
+        mock_client = AsyncMock()
+        mock_client.post = AsyncMock(side_effect=aiohttp.ClientError("Timeout"))
+
+        assets_data = {"listing": [], "total_value": 0}
+
+        with patch("intake_bot.services.legalserver.logger") as mock_logger:
+            await _save_assets_note(mock_client, "test-uuid", assets_data)
+            mock_logger.error.assert_called_once()
+
     async def test_successful_assets_note_creation_logs_debug(self):
         """Test that successful note creation is logged with total value."""
         mock_client = AsyncMock()
@@ -1574,6 +1624,54 @@ class TestSaveIntakeLegalserver:
                     "Matter creation response missing matter_uuid"
                 )
 
+    async def test_child_record_failure_does_not_stop_other_writes(self):
+        """Test that child records are all attempted when one write fails."""
+        state = {
+            "names": {"names": [{"first": "Test", "last": "User"}]},
+            "case_type": {"case_description": "Eviction notice"},
+            "assets": {"listing": [], "total_value": 0},
+        }
+
+        matter_response = MagicMock()
+        matter_response.status = 201
+        matter_response.json = AsyncMock(
+            return_value={"data": {"matter_uuid": "uuid-123", "case_id": 419645}}
+        )
+        note_response = MagicMock()
+        note_response.status = 201
+
+        async def post(url, headers, json):
+            if url.endswith("/matters"):
+                return matter_response
+            if json["subject"] == "Assets":
+                raise aiohttp.ServerTimeoutError("Connection timeout")
+            return note_response
+
+        with patch("aiohttp.ClientSession") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.__aenter__.return_value = mock_client
+            mock_client.post = AsyncMock(side_effect=post)
+            mock_client_class.return_value = mock_client
+
+            with patch("intake_bot.services.legalserver.logger") as mock_logger:
+                from intake_bot.services.legalserver import save_intake_legalserver
+
+                await save_intake_legalserver(state)
+
+                subjects = [
+                    call[1]["json"].get("subject")
+                    for call in mock_client.post.call_args_list[1:]
+                ]
+                assert sorted(subjects) == [
+                    "Assets",
+                    "Automatic Rejection: Other",
+                    "Case Description",
+                ]
+                assert any(
+                    "HTTP Request failed" in str(call)
+                    for call in mock_logger.error.call_args_list
+                )
+
     async def test_failed_matter_creation(self):
         """Test handling of failed matter creation."""
         state = {"names": {"names": [{"first": "Test", "last": "User"}]}}
@@ -303,6 +303,15 @@ def test_excluded_node_prompts_do_not_include_thank_you_acknowledgment_instructi
     assert "fits the caller's immediately preceding answer" not in content
 
 
+def test_node_prompts_get_returns_independent_copies():
+    prompts = NodePrompts()
+    prompt = prompts.get("record_name")
+    prompt["task_messages"][0]["content"] = "changed"
+
+    assert prompts.get("record_name")["task_messages"][0]["content"] != "changed"
+    assert prompts.get("record_name") == NodePrompts().get("record_name")
+
+
 def test_record_service_area_prompt_handles_non_location_answers():
     prompt = NodePrompts().get("record_service_area")
     content = prompt["task_messages"][0]["content"]
@@ -1409,3 +1418,30 @@ async def test_record_address_empty(flow_manager):
     assert result["status"] == Status.SUCCESS
     assert result.get("address") is None
     assert next_node is not None
+
+
+@pytest.mark.asyncio
+async def test_record_name_does_not_mutate_shared_partial_reset_node(flow_manager):
+    from intake_bot.nodes.nodes import _PARTIAL_RESET_NODE
+
+    shared_node = dict(_PARTIAL_RESET_NODE)
+    _, next_node = await record_name(flow_manager, "Jane", "", "Doe")
+    assert type(next_node) is dict
+    assert dict(_PARTIAL_RESET_NODE) == shared_node
+    with pytest.raises(TypeError):
+        _PARTIAL_RESET_NODE["functions"] = []
+
+
+@pytest.mark.asyncio
+async def test_continue_intake_rejects_non_flow_attribute(flow_manager):
+    with pytest.raises(ValueError):
+        await continue_intake(flow_manager, "prompts")
+
+
+@pytest.mark.asyncio
+async def test_continue_intake_resolves_flow_function(flow_manager):
+    result, next_node = await continue_intake(
+        flow_manager, "record_assets_receives_benefits"
+    )
+    assert result is None
+    assert next_node["functions"] == [record_assets_receives_benefits]
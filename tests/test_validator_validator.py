@@ -26,6 +26,8 @@ from intake_bot.nodes.validator import IntakeValidator
         ("aml", "Amelia County", 51007),  # WRatio partial match
         ("Nonexistent Place", "", 0),  # no match
         ("amelia county", "Amelia County", 51007),  # case-insensitive match
+        ("Amelia County.", "Amelia County", 51007),  # trailing punctuation
+        ("Isle-of-Wight", "Isle of Wight County", 51093),  # hyphenated name
         ("Amelia County City", "Amelia County", 51007),  # extra words
         ("Buckingham", "Buckingham County", 51029),  # another partial match
         ("Danville", "Danville City", 51595),  # city match
@@ -56,10 +58,12 @@ async def test_check_service_area(user_area, expected_match, expected_fips):
         ("866 534 5243", True, "(866) 534-5243"),  # with spaces
         ("866-5345-243", True, "(866) 534-5243"),  # wrong format
         ("866a534f5243.", True, "(866) 534-5243"),  # letters/symbol mixed
+        ("1-800-FLOWERS", True, "(800) 356-9377"),  # vanity number
         ("123-456-7890", False, "123-456-7890"),  # can't start with "1"
         ("abc-def-ghij", False, "abc-def-ghij"),  # letters only
         ("866534524", False, "866534524"),  # too short
         ("", False, ""),  # empty string
+        (None, False, None),  # missing
         ("+1 (866) 534-5243", True, "(866) 534-5243"),  # international format
         ("1-866-534-5243", True, "(866) 534-5243"),  # with leading 1
         ("+44 20 7946 0958", False, "+44 20 7946 0958"),  # non-US number
@@ -412,3 +416,19 @@ async def test_check_ssn_last_4(ssn_input, expected_valid, expected_formatted):
     is_valid, formatted_ssn = await validator.check_ssn_last_4(ssn_input)
     assert is_valid == expected_valid
     assert formatted_ssn == expected_formatted
+
+
+def test_classifier_is_created_on_first_use():
+    validator = IntakeValidator()
+    assert "classifier" not in vars(validator)
+    classifier = validator.classifier
+    assert validator.classifier is classifier
+
+
+@pytest.mark.asyncio
+async def test_check_service_area_reuses_previous_match():
+    validator = IntakeValidator()
+    first = await validator.check_service_area(location="Amelia")
+    second = await validator.check_service_area(location="Amelia")
+    assert first == second == ("Amelia County", 51007)
+    assert validator._match_service_area.cache_info().hits == 1